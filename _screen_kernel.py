@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+スクリーニング用の数値計算カーネル（Numba）
+- MA50/MA100/MA200 を終値配列の1パスで同時計算
+- MA200の傾き（最小二乗法の符号）も同じループで算出
+- 30日平均売買代金を先に判定し、流動性不足の銘柄はMA計算を省略
+- 全銘柄を (銘柄数, 日数) の行列にまとめ、prangeで銘柄ごとに並列処理
+- numba未インストール時は同じコードを純Pythonとして実行
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba未インストール時のダミーデコレータ"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+MA_SHORT       = 50     # ゴールデンクロス判定の短期MA
+MA_MID         = 100    # ゴールデンクロス判定の長期MA
+MA_LONG        = 200    # トレンド・底値クロス判定のMA
+TREND_LOOKBACK = 5      # MA200の傾きを見る日数
+VOLUME_DAYS    = 30     # 平均売買代金の計算日数
+
+FLAG_BOTTOM_CROSS = 1   # 底値が200日線とクロス
+FLAG_GOLDEN_CROSS = 2   # 50日/100日線のゴールデンクロス
+
+# NaN/Infを含む入力でも比較結果が変わらないよう nnan/ninf は有効にしない
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def screen_kernel(close):
+    """
+    1銘柄分のMAを1パスで計算
+    Args:
+        close: 終値配列（古い順）
+    Returns:
+        (ma50_prev, ma50_last, ma100_prev, ma100_last,
+         ma200_last, ma200_slope)
+        ma200_slope は直近TREND_LOOKBACK日の Σ(x - x̄)·MA200（符号のみ有効）。
+        データ不足の項目は NaN。
+    """
+    n = close.shape[0]
+    # 窓内の合計はNaNを除いて保持し、NaNの個数を別に数える
+    # （窓内にNaNがある間だけMAをNaNにする = pandas rolling(window).mean() と同じ）
+    s_short = 0.0
+    s_mid = 0.0
+    s_long = 0.0
+    nan_short = 0
+    nan_mid = 0
+    nan_long = 0
+    ma50_prev = np.nan
+    ma50_last = np.nan
+    ma100_prev = np.nan
+    ma100_last = np.nan
+    ma200_last = np.nan
+    ma200_slope = 0.0 if n >= MA_LONG + TREND_LOOKBACK - 1 else np.nan
+
+    trend_start = n - TREND_LOOKBACK
+    x_mean = (TREND_LOOKBACK - 1) / 2.0
+
+    for i in range(n):
+        c = close[i]
+        if np.isnan(c):
+            nan_short += 1
+            nan_mid += 1
+            nan_long += 1
+        else:
+            s_short += c
+            s_mid += c
+            s_long += c
+        if i >= MA_SHORT:
+            old = close[i - MA_SHORT]
+            if np.isnan(old):
+                nan_short -= 1
+            else:
+                s_short -= old
+        if i >= MA_MID:
+            old = close[i - MA_MID]
+            if np.isnan(old):
+                nan_mid -= 1
+            else:
+                s_mid -= old
+        if i >= MA_LONG:
+            old = close[i - MA_LONG]
+            if np.isnan(old):
+                nan_long -= 1
+            else:
+                s_long -= old
+
+        if i >= n - 2:
+            ma50 = s_short / MA_SHORT if i >= MA_SHORT - 1 and nan_short == 0 else np.nan
+            ma100 = s_mid / MA_MID if i >= MA_MID - 1 and nan_mid == 0 else np.nan
+            if i == n - 2:
+                ma50_prev = ma50
+                ma100_prev = ma100
+            else:
+                ma50_last = ma50
+                ma100_last = ma100
+
+        if i >= trend_start and i >= MA_LONG - 1:
+            # 窓内にNaNがあれば傾きもNaN（上昇トレンドと判定しない）
+            ma200 = s_long / MA_LONG if nan_long == 0 else np.nan
+            ma200_slope += ((i - trend_start) - x_mean) * ma200
+            ma200_last = ma200
+
+    return (ma50_prev, ma50_last, ma100_prev, ma100_last,
+            ma200_last, ma200_slope)
+
+
+@njit(cache=True, fastmath=FASTMATH_FLAGS)
+def traded_value_mean(close, volume):
+    """
+    直近VOLUME_DAYS日の平均売買代金（終値×出来高）
+    NaNは除外して平均する（pandas mean() の skipna と同じ）。全てNaNなら NaN。
+    """
+    n = close.shape[0]
+    total = 0.0
+    count = 0
+    for i in range(max(n - VOLUME_DAYS, 0), n):
+        yen = close[i] * volume[i]
+        if not np.isnan(yen):
+            total += yen
+            count += 1
+    return total / count if count > 0 else np.nan
+
+
+@njit(parallel=True, cache=True, fastmath=FASTMATH_FLAGS)
+def screen_all(close, low, volume, min_volume, out_flags, out_price, out_vol30):
+    """
+    全銘柄を一括スクリーニング
+    Args:
+        close, low, volume: (銘柄数, 日数) の行列。各行は右詰めで、
+                            データのない先頭部分は NaN
+        min_volume: 最低30日平均売買代金（円）。未満の銘柄はMA計算前に除外
+        out_flags: 出力。FLAG_BOTTOM_CROSS / FLAG_GOLDEN_CROSS のビット和
+                   （流動性不足・MA200が上昇トレンドでない・データ不足の場合は0）
+        out_price: 出力。最新終値
+        out_vol30: 出力。30日平均売買代金
+    """
+    n_tickers, n_days = close.shape
+    for t in prange(n_tickers):
+        start = 0
+        while start < n_days and np.isnan(close[t, start]):
+            start += 1
+
+        out_flags[t] = 0
+        out_price[t] = np.nan
+        out_vol30[t] = np.nan
+        if n_days - start < MA_LONG:
+            continue
+
+        last_close = close[t, n_days - 1]
+        out_price[t] = last_close
+
+        # 流動性チェックを先に行い、不足ならMA計算をスキップ
+        avg_volume_30d = traded_value_mean(close[t, start:], volume[t, start:])
+        out_vol30[t] = avg_volume_30d
+        if not avg_volume_30d >= min_volume:
+            continue
+
+        (ma50_prev, ma50_last, ma100_prev, ma100_last,
+         ma200_last, ma200_slope) = screen_kernel(close[t, start:])
+
+        if not ma200_slope > 0:
+            continue
+
+        flags = 0
+        if low[t, n_days - 1] <= ma200_last < last_close:
+            flags |= FLAG_BOTTOM_CROSS
+        if ma50_prev < ma100_prev and ma50_last >= ma100_last:
+            flags |= FLAG_GOLDEN_CROSS
+        out_flags[t] = flags
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+スクリーニングカーネルのAOTコンパイル
+- _screen_kernel.screen_all を numba.pycc で共有ライブラリ（screen_kernels）に事前コンパイル
+- 実行時のJITコンパイル待ち（初回1〜2秒）をなくし、定時実行を即座に開始できる
+- AOT版は prange による並列化が効かないため、並列版が必要な場合はビルドしない
+  （未ビルド時は stock_screener.py が @njit(cache=True) 版を使用）
+
+使い方:
+    python build_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from _screen_kernel import screen_all
+
+
+cc = CC('screen_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# close, low, volume, min_volume, out_flags, out_price, out_vol30
+cc.export(
+    'screen_all',
+    'void(f4[:,:], f4[:,:], f4[:,:], f8, i1[:], f4[:], f4[:])'
+)(screen_all.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ screen_kernels をコンパイルしました（{cc.output_dir}）")
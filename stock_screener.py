@@ -11,13 +11,37 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import time
 import requests
 import json
 import os
-from typing import List, Dict, Optional
+import io
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import warnings
-warnings.filterwarnings('ignore')
+
+from _screen_kernel import screen_all, FLAG_BOTTOM_CROSS, FLAG_GOLDEN_CROSS
+try:
+    # build_kernels.py でAOTコンパイル済みならJITコンパイルを省略
+    from screen_kernels import screen_all
+except ImportError:
+    pass
+
+
+# ─────────────────────────────────────────────
+#  定数定義
+# ─────────────────────────────────────────────
+DOWNLOAD_CHUNK_SIZE = 200   # yf.download 1回あたりの銘柄数
+MAX_WORKERS         = 16    # 銘柄スクリーニングの並列スレッド数
+REQUEST_TIMEOUT     = 10    # yfinance 1リクエストあたりのタイムアウト（秒）
+PRICE_COLUMNS       = ['Close', 'Low', 'Volume']  # スクリーニングで使う列のみ保持
+OHLCV_CACHE_DIR     = "cache"   # 株価データキャッシュ（ohlcv_YYYYMMDD.parquet）
+RISK_THRESHOLDS     = [10_000_000, 100_000_000]           # 1000万円 / 1億円
+RISK_TAGS           = np.array(["🔴冒険", "🟡標準", "🟢安定"])  # 流動性によるリスクタグ
+NAME_CACHE_PATH     = "data/names.json"  # 銘柄名キャッシュ（コード → 銘柄名）
+JPX_LIST_URL        = "https://www.jpx.co.jp/markets/statistics-equities/misc/tvdivq0000001vg2-att/data_j.xls"
+JPX_CACHE_PATH      = "data/jpx_list.parquet"   # JPX銘柄リストのキャッシュ
+JPX_CACHE_MAX_AGE   = timedelta(days=7)         # キャッシュの有効期間
+JPX_BUNDLED_CSV     = "data/jpx_stock_list.csv"  # リポジトリ同梱の銘柄リスト
 
 
 class StockScreener:
@@ -30,13 +54,99 @@ class StockScreener:
         """
         self.min_volume = min_volume
         self.results = []
+        self._name_cache = self._load_name_cache()
+    
+    def _load_name_cache(self) -> Dict[str, str]:
+        """銘柄名キャッシュをJSONから読み込み（なければ空）"""
+        try:
+            with open(NAME_CACHE_PATH, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_name_cache(self):
+        """銘柄名キャッシュをJSONに保存"""
+        try:
+            os.makedirs(os.path.dirname(NAME_CACHE_PATH), exist_ok=True)
+            with open(NAME_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self._name_cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"⚠️ 銘柄名キャッシュの保存に失敗: {e}")
         
     def get_jpx_stock_list(self) -> pd.DataFrame:
         """
         東証上場銘柄リストを取得する。
-        JPXのxlsファイルはpandas/xlrdの互換性問題で取得不可なため、
-        証券コード（1000〜9999）を総当たりしてyfinanceで存在確認する方式を採用。
-        初回は時間がかかるが、確実に全銘柄をカバーできる。
+        JPX公式の上場銘柄一覧（data_j.xls）をダウンロードし、株式のみに絞り込む。
+        取得結果は JPX_CACHE_PATH にキャッシュし、JPX_CACHE_MAX_AGE 以内なら再利用する。
+        取得できない場合は古いキャッシュ → 同梱CSV → コード総当たりの順にフォールバック。
+        """
+        print("📥 東証銘柄リストを取得中...")
+        
+        cache_age = self._cache_age(JPX_CACHE_PATH)
+        if cache_age is not None and cache_age < JPX_CACHE_MAX_AGE:
+            try:
+                df = pd.read_parquet(JPX_CACHE_PATH)
+                print(f"✅ {len(df)}銘柄を読み込みました（キャッシュ）")
+                return df
+            except Exception as e:
+                print(f"⚠️ キャッシュ読み込みエラー: {e}")
+        
+        try:
+            df = self._download_jpx_list()
+            print(f"✅ {len(df)}銘柄を取得しました（JPX公式リスト）")
+            try:
+                os.makedirs(os.path.dirname(JPX_CACHE_PATH), exist_ok=True)
+                df.to_parquet(JPX_CACHE_PATH, index=False)
+            except Exception as e:
+                print(f"⚠️ キャッシュ保存エラー: {e}")
+            return df
+        except Exception as e:
+            print(f"⚠️ JPXリスト取得エラー: {e}")
+        
+        for path, reader in ((JPX_CACHE_PATH, pd.read_parquet),
+                             (JPX_BUNDLED_CSV, lambda p: pd.read_csv(p, dtype={'code': str}))):
+            if not os.path.exists(path):
+                continue
+            try:
+                df = self._filter_equities(reader(path))
+                print(f"📋 フォールバック: {path} から{len(df)}銘柄を読み込みました")
+                return df
+            except Exception as e:
+                print(f"⚠️ {path} 読み込みエラー: {e}")
+        
+        return self._get_code_sweep()
+    
+    def _cache_age(self, path: str) -> Optional[timedelta]:
+        """ファイルの最終更新からの経過時間（ファイルがなければNone）"""
+        if not os.path.exists(path):
+            return None
+        return datetime.now() - datetime.fromtimestamp(os.path.getmtime(path))
+    
+    def _download_jpx_list(self) -> pd.DataFrame:
+        """JPX公式の上場銘柄一覧（data_j.xls）を取得して株式のみに絞り込む"""
+        response = requests.get(JPX_LIST_URL, timeout=30)
+        response.raise_for_status()
+        
+        # data_j.xls は旧形式（BIFF）のため openpyxl では読めず xlrd が必要
+        raw = pd.read_excel(io.BytesIO(response.content), engine='xlrd', dtype={'コード': str})
+        df = pd.DataFrame({
+            'code': raw['コード'].astype(str).str.strip().str.zfill(4),
+            'name': raw['銘柄名'].astype(str).str.strip(),
+            'market': raw['市場・商品区分'].astype(str),
+            'sector': raw['33業種区分'].astype(str),
+        })
+        return self._filter_equities(df)
+    
+    def _filter_equities(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ETF・REIT等を除き、株式（内国株式・外国株式）のみを残す"""
+        if 'market' in df.columns:
+            df = df[df['market'].str.contains('株式', na=False)]
+        return df.reset_index(drop=True)
+    
+    def _get_code_sweep(self) -> pd.DataFrame:
+        """
+        証券コードを総当たりで生成する（JPXリスト取得失敗時のフォールバック）
+        存在しない銘柄はスクリーニング時に自動スキップされる。
         """
         print("📥 東証銘柄リストを生成中（コード総当たり方式）...")
 
@@ -46,25 +156,16 @@ class StockScreener:
         
         # 方式: 既知の主要銘柄コード帯を直接指定
         # プライム・スタンダード・グロース市場の典型的なコード範囲
-        code_ranges = list(range(1300, 1500)) + \
-                      list(range(1700, 2000)) + \
-                      list(range(2000, 3000)) + \
-                      list(range(3000, 4000)) + \
-                      list(range(4000, 5000)) + \
-                      list(range(5000, 6000)) + \
-                      list(range(6000, 7000)) + \
-                      list(range(7000, 8000)) + \
-                      list(range(8000, 9000)) + \
-                      list(range(9000, 9999))
+        codes = np.concatenate([
+            np.arange(1300, 1500),
+            np.arange(1700, 2000),
+            np.arange(2000, 9000),
+            np.arange(9000, 9999)
+        ])
+        code_str = np.char.zfill(codes.astype(str), 4)
 
-        stocks = []
-        for code in code_ranges:
-            stocks.append({
-                'code': str(code).zfill(4),
-                'name': str(code)  # 名称はyfinanceから後で取得
-            })
-
-        df = pd.DataFrame(stocks)
+        # 名称はyfinanceから後で取得（コード番号を仮の名称とする）
+        df = pd.DataFrame({'code': code_str, 'name': code_str})
         print(f"✅ {len(df)}件のコードを生成しました（存在しない銘柄はスクリーニング時に自動スキップ）")
         return df
     
@@ -76,43 +177,6 @@ class StockScreener:
         }
         return pd.DataFrame(sample_stocks)
     
-    def calculate_ma(self, prices: pd.Series, period: int) -> pd.Series:
-        """移動平均線を計算"""
-        return prices.rolling(window=period).mean()
-    
-    def is_ma_trending_up(self, ma: pd.Series, lookback: int = 5) -> bool:
-        """
-        移動平均線が上昇トレンドか判定
-        Args:
-            ma: 移動平均線のSeries
-            lookback: 直近何日間の傾きを見るか
-        """
-        if len(ma) < lookback:
-            return False
-        recent_ma = ma.iloc[-lookback:].values
-        # 最小二乗法で傾きを計算
-        x = np.arange(lookback)
-        slope = np.polyfit(x, recent_ma, 1)[0]
-        return slope > 0
-    
-    def check_bottom_cross_ma200(self, low: float, close: float, ma200: float) -> bool:
-        """底値が200日線とクロスしたか判定"""
-        return low <= ma200 < close
-    
-    def check_golden_cross(self, ma_short: pd.Series, ma_long: pd.Series) -> bool:
-        """ゴールデンクロス発生を判定"""
-        if len(ma_short) < 2 or len(ma_long) < 2:
-            return False
-        
-        # 前日: 短期MA < 長期MA
-        # 当日: 短期MA >= 長期MA
-        prev_short = ma_short.iloc[-2]
-        prev_long = ma_long.iloc[-2]
-        curr_short = ma_short.iloc[-1]
-        curr_long = ma_long.iloc[-1]
-        
-        return prev_short < prev_long and curr_short >= curr_long
-    
     def calculate_win_rate(self, data: pd.DataFrame, signal_dates: List[str], 
                           forward_days: int = 5) -> float:
         """
@@ -127,20 +191,24 @@ class StockScreener:
         if not signal_dates:
             return 0.0
         
-        wins = 0
-        total = 0
+        # シグナル日の位置をまとめて検索（インデックスにない日付は除外）
+        dates = pd.to_datetime(signal_dates, errors='coerce')
+        if data.index.tz is not None:
+            # data.index 由来のTimestampはtz付きのため変換、文字列由来はローカライズ
+            dates = (dates.tz_convert(data.index.tz) if dates.tz is not None
+                     else dates.tz_localize(data.index.tz))
+        elif dates.tz is not None:
+            dates = dates.tz_localize(None)
+        idx_arr = data.index.searchsorted(dates)
+        found = idx_arr < len(data)
+        found[found] = data.index[idx_arr[found]] == dates[found]
+        valid = found & (idx_arr + forward_days < len(data))
         
-        for signal_date in signal_dates:
-            try:
-                signal_idx = data.index.get_loc(signal_date)
-                if signal_idx + forward_days < len(data):
-                    entry_price = data['Close'].iloc[signal_idx]
-                    exit_price = data['Close'].iloc[signal_idx + forward_days]
-                    if exit_price > entry_price:
-                        wins += 1
-                    total += 1
-            except:
-                continue
+        close = data['Close'].values
+        entry = close[idx_arr[valid]]
+        exit_ = close[idx_arr[valid] + forward_days]
+        wins = int((exit_ > entry).sum())
+        total = int(valid.sum())
         
         return (wins / total * 100) if total > 0 else 0.0
     
@@ -158,75 +226,244 @@ class StockScreener:
         try:
             # データ取得（過去1年分）
             ticker = yf.Ticker(ticker_symbol)
-            data = ticker.history(period="1y")
-            
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)  # yfinance内部のpandas警告
+                data = ticker.history(
+                    period="1y",
+                    actions=False,
+                    auto_adjust=False,
+                    prepost=False,
+                    timeout=REQUEST_TIMEOUT
+                )
+            data = data[PRICE_COLUMNS].astype(np.float32)
+        except Exception:
+            return None
+        
+        return self._screen_from_frame(code, name, data)
+    
+    def _screen_from_frame(self, code: str, name: str, data: pd.DataFrame) -> Optional[Dict]:
+        """
+        取得済みの株価データから個別銘柄をスクリーニング
+        判定は一括スキャンと同じカーネル（screen_all）を1銘柄分で実行する。
+        Args:
+            code: 銘柄コード（4桁）
+            name: 銘柄名（不明な場合はコード番号）
+            data: 過去1年分の株価データ（Close/Low/Volume）
+        Returns:
+            条件に合致した場合は銘柄情報の辞書、不合格ならNone
+        """
+        try:
             if data.empty or len(data) < 200:
                 return None
             
-            # yfinanceから銘柄名を取得（JPXリストにない場合の補完）
-            if name == code:  # 名称未取得の場合
-                try:
-                    info = ticker.info
-                    name = info.get('longName') or info.get('shortName') or code
-                except Exception:
-                    name = code
-            
-            # 流動性チェック（30日平均売買代金）
-            data['Volume_Yen'] = data['Close'] * data['Volume']
-            avg_volume_30d = data['Volume_Yen'].tail(30).mean()
-            
-            if avg_volume_30d < self.min_volume:
-                return None
-            
-            # 移動平均線を計算
-            data['MA50'] = self.calculate_ma(data['Close'], 50)
-            data['MA100'] = self.calculate_ma(data['Close'], 100)
-            data['MA200'] = self.calculate_ma(data['Close'], 200)
-            
-            # 最新データ
-            latest = data.iloc[-1]
+            out_flags, out_price, out_vol30, dates = self._run_screen({code: data}, [code])
             
-            # 条件1: 200日線が上昇トレンドか
-            if not self.is_ma_trending_up(data['MA200']):
+            flags = int(out_flags[0])
+            if flags == 0:
                 return None
             
-            # 条件2: 底値が200日線とクロス
-            bottom_cross = self.check_bottom_cross_ma200(
-                latest['Low'], 
-                latest['Close'], 
-                latest['MA200']
+            # yfinanceから銘柄名を取得（JPXリストにない場合の補完）
+            name = self._resolve_name(code, name)
+            return self._build_result(
+                code, name, float(out_price[0]),
+                bool(flags & FLAG_BOTTOM_CROSS), bool(flags & FLAG_GOLDEN_CROSS),
+                float(out_vol30[0]), dates[0]
             )
             
-            # 条件3: 50日/100日線のゴールデンクロス
-            golden_cross = self.check_golden_cross(data['MA50'], data['MA100'])
+        except Exception as e:
+            # エラーは静かに無視（多数の銘柄を処理するため）
+            return None
+    
+    def _resolve_name(self, code: str, name: str) -> str:
+        """銘柄名が未取得（コード番号のまま）ならyfinanceから補完"""
+        if name != code:
+            return name
+        return self._ticker_name(code)
+    
+    def _ticker_name(self, code: str) -> str:
+        """銘柄名を取得（キャッシュ優先、未登録ならticker.infoを参照）"""
+        if code in self._name_cache:
+            return self._name_cache[code]
+        try:
+            info = yf.Ticker(f"{code}.T").info
+            name = info.get('longName') or info.get('shortName')
+        except Exception:
+            name = None
+        if not name:
+            return code  # 取得失敗は次回再取得するためキャッシュしない
+        self._name_cache[code] = name
+        return name
+    
+    def _risk_tags(self, avg_volumes):
+        """
+        30日平均売買代金からリスクタグ（流動性）を判定（配列で一括判定可）
+        1億円以上: 🟢安定 / 1000万円以上: 🟡標準 / それ未満: 🔴冒険
+        """
+        # side='right' で閾値ちょうどを上位のタグに含める
+        return RISK_TAGS[np.searchsorted(RISK_THRESHOLDS, avg_volumes, side='right')]
+    
+    def _build_result(self, code: str, name: str, price: float,
+                      bottom_cross: bool, golden_cross: bool,
+                      avg_volume_30d: float, date: str,
+                      risk_tag: Optional[str] = None) -> Dict:
+        """条件合致銘柄の結果辞書を作成（risk_tag省略時は流動性から判定）"""
+        if risk_tag is None:
+            risk_tag = str(self._risk_tags(avg_volume_30d))
+        
+        return {
+            'code': code,
+            'name': name,
+            'price': price,
+            'ma200_trend': '上昇',
+            'bottom_cross': '✅' if bottom_cross else '—',
+            'golden_cross': '✅' if golden_cross else '—',
+            'avg_volume_30d': avg_volume_30d,
+            'risk_tag': risk_tag,
+            'date': date
+        }
+    
+    def download_history(self, codes: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        複数銘柄の過去1年分データをまとめて取得
+        Args:
+            codes: 銘柄コード（4桁）のリスト
+        Returns:
+            {銘柄コード: 株価データ（Close/Low/Volume, float32）}（取得できなかった銘柄は含まない）
+        """
+        frames = {}
+        
+        for start in range(0, len(codes), DOWNLOAD_CHUNK_SIZE):
+            chunk = codes[start:start + DOWNLOAD_CHUNK_SIZE]
+            symbols = [f"{c}.T" for c in chunk]
             
-            # いずれかの条件に合致
-            if bottom_cross or golden_cross:
-                # リスクタグ（流動性）
-                if avg_volume_30d >= 100_000_000:  # 1億円以上
-                    risk_tag = "🟢安定"
-                elif avg_volume_30d >= 10_000_000:  # 1000万円以上
-                    risk_tag = "🟡標準"
-                else:
-                    risk_tag = "🔴冒険"
-                
-                return {
-                    'code': code,
-                    'name': name,
-                    'price': latest['Close'],
-                    'ma200_trend': '上昇',
-                    'bottom_cross': '✅' if bottom_cross else '—',
-                    'golden_cross': '✅' if golden_cross else '—',
-                    'avg_volume_30d': avg_volume_30d,
-                    'risk_tag': risk_tag,
-                    'date': latest.name.strftime('%Y-%m-%d')
-                }
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', FutureWarning)  # yfinance内部のpandas警告
+                    data = yf.download(
+                        symbols,
+                        period="1y",
+                        group_by='ticker',
+                        threads=True,
+                        progress=False,
+                        auto_adjust=False,
+                        actions=False,
+                        prepost=False,
+                        timeout=REQUEST_TIMEOUT
+                    )
+            except Exception as e:
+                print(f"  ⚠️ 一括取得エラー（{start + 1}〜{start + len(chunk)}件目）: {e}")
+                continue
             
-            return None
+            if data.empty:
+                continue
+            
+            # 1銘柄のみの場合はMultiIndexにならないバージョンがある
+            if not isinstance(data.columns, pd.MultiIndex):
+                data = pd.concat({symbols[0]: data}, axis=1)
             
+            available = set(data.columns.get_level_values(0))
+            for code, sym in zip(chunk, symbols):
+                if sym not in available:
+                    continue
+                df = data.xs(sym, axis=1, level=0)[PRICE_COLUMNS].dropna(how='all')
+                if not df.empty:
+                    frames[code] = df.astype(np.float32)
+        
+        return frames
+    
+    def load_history(self, codes: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        株価データを取得（当日分のParquetキャッシュがあれば優先）
+        キャッシュにない銘柄のみダウンロードし、キャッシュに追記する。
+        Args:
+            codes: 銘柄コード（4桁）のリスト
+        Returns:
+            {銘柄コード: 株価データ（Close/Low/Volume, float32）}
+        """
+        cache_path = os.path.join(OHLCV_CACHE_DIR, f"ohlcv_{datetime.now().strftime('%Y%m%d')}.parquet")
+        cached = self._load_ohlcv_cache(cache_path)
+        
+        frames = {c: cached[c] for c in codes if c in cached}
+        missing = [c for c in codes if c not in cached]
+        if frames:
+            print(f"💾 キャッシュから{len(frames)}銘柄を読み込みました（{cache_path}）")
+        
+        if missing:
+            print(f"📥 株価データを一括取得中（{len(missing)}銘柄、{DOWNLOAD_CHUNK_SIZE}銘柄ずつ）...")
+            downloaded = self.download_history(missing)
+            frames.update(downloaded)
+            if downloaded:
+                cached.update(downloaded)
+                self._save_ohlcv_cache(cache_path, cached)
+        
+        return frames
+    
+    def _load_ohlcv_cache(self, path: str) -> Dict[str, pd.DataFrame]:
+        """ロング形式のParquetキャッシュを銘柄ごとのDataFrameに戻す"""
+        if not os.path.exists(path):
+            return {}
+        try:
+            long_df = pd.read_parquet(path)
         except Exception as e:
-            # エラーは静かに無視（多数の銘柄を処理するため）
-            return None
+            print(f"⚠️ 株価キャッシュ読み込みエラー: {e}")
+            return {}
+        
+        long_df = long_df.rename(columns={c.lower(): c for c in PRICE_COLUMNS})
+        return {
+            str(code): group.set_index('date')[PRICE_COLUMNS].astype(np.float32)
+            for code, group in long_df.groupby('code', observed=True, sort=False)
+        }
+    
+    def _save_ohlcv_cache(self, path: str, frames: Dict[str, pd.DataFrame]):
+        """銘柄ごとのDataFrameをロング形式（code, date, close, low, volume）で保存"""
+        try:
+            long_df = pd.concat(frames, names=['code', 'date']).reset_index()
+            long_df = long_df.rename(columns={c: c.lower() for c in PRICE_COLUMNS})
+            long_df['code'] = long_df['code'].astype('category')
+            os.makedirs(OHLCV_CACHE_DIR, exist_ok=True)
+            long_df.to_parquet(path, compression='zstd', index=False)
+        except Exception as e:
+            print(f"⚠️ 株価キャッシュ保存エラー: {e}")
+    
+    def _stack_frames(self, frames: Dict[str, pd.DataFrame], codes: List[str]
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        銘柄ごとのデータを (銘柄数, 日数) のfloat32行列に積み上げる
+        各行は右詰め（最新日が最終列）で、データのない先頭部分は NaN
+        Returns:
+            (終値, 安値, 出来高, 各銘柄の最新日付)
+        """
+        n_days = max(len(frames[c]) for c in codes)
+        shape = (len(codes), n_days)
+        close = np.full(shape, np.nan, dtype=np.float32)
+        low = np.full(shape, np.nan, dtype=np.float32)
+        volume = np.full(shape, np.nan, dtype=np.float32)
+        dates = []
+        
+        for i, code in enumerate(codes):
+            df = frames[code]
+            n = len(df)
+            close[i, n_days - n:] = df['Close'].to_numpy()
+            low[i, n_days - n:] = df['Low'].to_numpy()
+            volume[i, n_days - n:] = df['Volume'].to_numpy()
+            dates.append(df.index[-1].strftime('%Y-%m-%d'))
+        
+        return close, low, volume, dates
+    
+    def _run_screen(self, frames: Dict[str, pd.DataFrame], codes: List[str]
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        スクリーニングカーネルを実行（一括スキャン・個別銘柄の共通処理）
+        Returns:
+            (判定フラグ, 最新終値, 30日平均売買代金, 各銘柄の最新日付)
+            判定フラグは流動性不足（min_volume未満）の銘柄も0
+        """
+        close, low, volume, dates = self._stack_frames(frames, codes)
+        out_flags = np.zeros(len(codes), dtype=np.int8)
+        out_price = np.zeros(len(codes), dtype=np.float32)
+        out_vol30 = np.zeros(len(codes), dtype=np.float32)
+        screen_all(close, low, volume, float(self.min_volume), out_flags, out_price, out_vol30)
+        return out_flags, out_price, out_vol30, dates
     
     def scan_all_stocks(self, max_stocks: Optional[int] = None) -> List[Dict]:
         """
@@ -243,23 +480,50 @@ class StockScreener:
         total = len(stocks_df)
         print(f"🔍 {total}銘柄のスクリーニングを開始します...\n")
         
+        # 株価データを一括取得（銘柄ごとのHTTPリクエストを回避）
+        frames = self.load_history(stocks_df['code'].tolist())
+        print(f"✅ {len(frames)}銘柄のデータを取得しました\n")
+        
+        all_codes = stocks_df['code'].to_numpy()
+        codes = [c for c in all_codes if c in frames]
+        names = dict(zip(all_codes, stocks_df['name'].to_numpy()))
         results = []
         
-        for idx, row in stocks_df.iterrows():
-            code = row['code']
-            name = row['name']
+        if codes:
+            # 全銘柄を1回のカーネル呼び出しでスクリーニング
+            out_flags, out_price, out_vol30, dates = self._run_screen(frames, codes)
             
-            # プログレス表示
-            if (idx + 1) % 50 == 0:
-                print(f"進捗: {idx + 1}/{total} 銘柄処理済み ({len(results)}銘柄が条件合致)")
+            hits = np.flatnonzero(out_flags != 0)
+            print(f"🎯 {len(hits)}銘柄が条件合致（銘柄名を取得中...）")
             
-            result = self.screen_stock(code, name)
-            if result:
-                results.append(result)
-                print(f"  ✅ {code} {name}: 条件合致")
+            # 銘柄名の補完（ticker.info）がI/O待ちになるためスレッドで並列化
+            # 結果の組み立てはメインスレッドのみで行う
+            resolved = {}
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+                futures = {
+                    ex.submit(self._resolve_name, codes[i], names[codes[i]]): codes[i]
+                    for i in hits
+                }
+                
+                for future in as_completed(futures):
+                    code = futures[future]
+                    resolved[code] = future.result()
+                    print(f"  ✅ {code} {resolved[code]}: 条件合致")
             
-            # レート制限対策（0.5秒待機）
-            time.sleep(0.5)
+            # リスクタグ・クロス判定は合致銘柄分をまとめて処理
+            tags = self._risk_tags(out_vol30[hits])
+            bottom = (out_flags[hits] & FLAG_BOTTOM_CROSS) != 0
+            golden = (out_flags[hits] & FLAG_GOLDEN_CROSS) != 0
+            results = [
+                self._build_result(
+                    codes[i], resolved[codes[i]], float(out_price[i]),
+                    bool(bc), bool(gc), float(out_vol30[i]), dates[i], risk_tag=str(tag)
+                )
+                for i, tag, bc, gc in zip(hits, tags, bottom, golden)
+            ]
+        
+        self.results = results
+        self._save_name_cache()
         
         print(f"\n✅ スキャン完了: {len(results)}銘柄が条件に合致")
         return results
@@ -276,6 +540,8 @@ class Notifier:
         self.service = service
         self.slack_webhook = os.getenv("SLACK_WEBHOOK_URL")
         self.discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
+        # 送信ごとのTCP/TLS接続を避けるため接続を使い回す
+        self.session = requests.Session()
     
     def format_message(self, results: List[Dict]) -> str:
         """通知メッセージをフォーマット"""
@@ -290,29 +556,30 @@ class Notifier:
 💰 現金でお待ちください。
 """
         
-        msg = f"""
+        parts = [f"""
 📊 日本株スクリーニング結果
 📅 {today}
 
 🎯 {len(results)}銘柄が条件に合致しました:
 
-"""
+"""]
         
         for r in results[:10]:  # 最大10銘柄
-            msg += f"""
+            volume_oku = r['avg_volume_30d'] / 1e8
+            parts.append(f"""
 【{r['code']}】{r['name']}
 💵 株価: ¥{r['price']:.0f}
 📈 200日線: {r['ma200_trend']}
 🔄 底値クロス: {r['bottom_cross']}
 ⭐ GC: {r['golden_cross']}
-{r['risk_tag']} 流動性: ¥{r['avg_volume_30d']/1e8:.1f}億
+{r['risk_tag']} 流動性: ¥{volume_oku:.1f}億
 
-"""
+""")
         
         if len(results) > 10:
-            msg += f"\n...他{len(results)-10}銘柄"
+            parts.append(f"\n...他{len(results)-10}銘柄")
         
-        return msg
+        return ''.join(parts)
     
     def send_slack(self, message: str):
         """Slackで送信"""
@@ -321,7 +588,7 @@ class Notifier:
             return
         
         payload = {"text": message}
-        response = requests.post(self.slack_webhook, json=payload)
+        response = self.session.post(self.slack_webhook, json=payload)
         
         if response.status_code == 200:
             print("✅ Slack通知を送信しました")
@@ -335,7 +602,7 @@ class Notifier:
             return
         
         payload = {"content": message}
-        response = requests.post(self.discord_webhook, json=payload)
+        response = self.session.post(self.discord_webhook, json=payload)
         
         if response.status_code == 204:
             print("✅ Discord通知を送信しました")
@@ -55,7 +55,6 @@ try:
     load_dotenv()
 except ImportError:
     pass  # GitHub Actions では不要
-warnings.filterwarnings('ignore')
 import jpholiday
 import sys
 
@@ -335,7 +334,9 @@ class HTMLReportGenerator:
             plt.rcParams['font.family'] = ['Yu Gothic', 'Meiryo', 'DejaVu Sans']
 
             ticker_obj = yf.Ticker(f"{code}.T")
-            data = ticker_obj.history(period='3mo')
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)  # yfinance内部のpandas警告
+                data = ticker_obj.history(period='3mo')
 
             if data.empty or len(data) < 20:
                 return None
@@ -1722,16 +1723,22 @@ class AdvancedStockScreener:
         """シグナル後勝率を計算（後方互換）"""
         if not signal_dates:
             return 0.0, 0, 0
-        wins, total = 0, 0
-        for sd in signal_dates:
-            try:
-                idx = data.index.get_loc(sd)
-                if idx + forward_days < len(data):
-                    if data['Close'].iloc[idx + forward_days] > data['Close'].iloc[idx]:
-                        wins += 1
-                    total += 1
-            except (KeyError, ValueError):
-                continue
+        # シグナル日の位置をまとめて検索（インデックスにない日付は除外）
+        dates = pd.to_datetime(signal_dates, errors='coerce')
+        if data.index.tz is not None:
+            # data.index 由来のTimestampはtz付きのため変換、文字列由来はローカライズ
+            dates = (dates.tz_convert(data.index.tz) if dates.tz is not None
+                     else dates.tz_localize(data.index.tz))
+        elif dates.tz is not None:
+            dates = dates.tz_localize(None)
+        idx_arr = data.index.searchsorted(dates)
+        found = idx_arr < len(data)
+        found[found] = data.index[idx_arr[found]] == dates[found]
+        valid = found & (idx_arr + forward_days < len(data))
+
+        close = data['Close'].values
+        wins  = int((close[idx_arr[valid] + forward_days] > close[idx_arr[valid]]).sum())
+        total = int(valid.sum())
         return (wins / total * 100) if total > 0 else 0.0, wins, total
 
     def calculate_volatility(self, data: pd.DataFrame, window: int = 20) -> float:
@@ -1772,11 +1779,22 @@ class AdvancedStockScreener:
         try:
             ticker = yf.Ticker(ticker_symbol)
             # バックテスト + 一目均衡表に十分なデータ確保（最低2年）
-            data = ticker.history(period="2y")
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)  # yfinance内部のpandas警告
+                data = ticker.history(period="2y")
 
             if data.empty or len(data) < MA_LONG:
                 return None
 
+            # ── 流動性チェック ───────────────────────────────────────
+            # 売買代金の列を作らず直近30日分だけで計算し、指標計算・info取得の前に除外
+            # NaNは除外して平均（旧 Volume_Yen.tail(30).mean() と同じ）、全てNaNなら除外
+            tail_yen = data['Close'].values[-30:] * data['Volume'].values[-30:]
+            tail_yen = tail_yen[~np.isnan(tail_yen)]
+            avg_volume_30d = float(tail_yen.mean()) if tail_yen.size else np.nan
+            if not avg_volume_30d >= self.min_volume:
+                return None
+
             # ── 銘柄名・セクター補完 ──────────────────────────────────
             info = {}
             if name == code:
@@ -1804,11 +1822,6 @@ class AdvancedStockScreener:
             data['MA50']  = data['Close'].rolling(50).mean()
             data['MA100'] = data['Close'].rolling(100).mean()
 
-            # ── 流動性チェック ───────────────────────────────────────
-            avg_volume_30d = data['Volume_Yen'].tail(30).mean()
-            if avg_volume_30d < self.min_volume:
-                return None
-
             latest = data.iloc[-1]
             prev   = data.iloc[-2] if len(data) >= 2 else latest
 
@@ -1991,14 +2004,20 @@ class AdvancedStockScreener:
         total = len(stocks_df)
         print(f"🔍 {total}銘柄のスクリーニングを開始（最低スコア: {self.min_score}点）\n")
 
+        # iterrows() は行ごとにSeriesを生成するため、列配列を直接走査する
+        codes   = stocks_df['code'].to_numpy()
+        names   = stocks_df['name'].to_numpy()
+        sectors = (stocks_df['sector'].to_numpy() if 'sector' in stocks_df.columns
+                   else np.full(total, '不明', dtype=object))
+
         results = []
-        for idx, row in stocks_df.iterrows():
-            code   = row['code']
-            name   = row['name']
-            sector = row.get('sector', '不明')
+        for i in range(total):
+            code   = codes[i]
+            name   = names[i]
+            sector = sectors[i]
 
-            if (idx + 1) % 50 == 0:
-                print(f"進捗: {idx + 1}/{total} ({len(results)}銘柄合致)")
+            if (i + 1) % 50 == 0:
+                print(f"進捗: {i + 1}/{total} ({len(results)}銘柄合致)")
 
             result = self.screen_stock(code, name, sector)
             if result: